@@ -116,7 +116,20 @@ async def build_graph(checkpointer, tool_modules: list[str] | None = None):
     tools = collect_tools(include_modules=tool_modules)
     logger.info(f"Building graph with {len(tools)} tools")
 
-    # Define agent_node as a closure so it can access the local 'tools' variable
+    def _bound_llm(max_tokens: int):
+        llm = ChatOpenAI(
+            model=settings.llm_model,
+            api_key=settings.openai_api_key,
+            max_tokens=max_tokens,
+            temperature=0.7,
+        )
+        return llm.bind_tools(tools) if tools else llm
+
+    # Bind tools once per graph; converting tool schemas on every turn is wasted work
+    voice_llm = _bound_llm(settings.voice_max_tokens)
+    chat_llm = _bound_llm(settings.chat_max_tokens)
+
+    # Define agent_node as a closure so it can access the bound LLMs
     async def agent_node(state: AgentState, config: RunnableConfig) -> dict:
         """Call the LLM with personality prompt, memories, and conversation history."""
         source = config.get("configurable", {}).get("source", "voice")
@@ -124,10 +137,10 @@ async def build_graph(checkpointer, tool_modules: list[str] | None = None):
         # Pick prompt and token limit based on source
         if source == "voice":
             system_prompt = VOICE_SYSTEM_PROMPT
-            max_tokens = settings.voice_max_tokens
+            llm = voice_llm
         else:
             system_prompt = CHAT_SYSTEM_PROMPT
-            max_tokens = settings.chat_max_tokens
+            llm = chat_llm
 
         # Inject current date/time so the LLM knows when "today" and "tonight" are
         tz = ZoneInfo(settings.timezone)
@@ -140,17 +153,6 @@ async def build_graph(checkpointer, tool_modules: list[str] | None = None):
             memory_text = "\n".join(f"- {m['content']}" for m in memories)
             system_prompt += MEMORY_CONTEXT_TEMPLATE.format(memories=memory_text)
 
-        llm = ChatOpenAI(
-            model=settings.llm_model,
-            api_key=settings.openai_api_key,
-            max_tokens=max_tokens,
-            temperature=0.7,
-        )
-
-        # Bind tools if we have any (uses local 'tools' variable from closure)
-        if tools:
-            llm = llm.bind_tools(tools)
-
         # Build message list: system prompt + conversation history
         messages = [SystemMessage(content=system_prompt)] + state["messages"]
 
@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     ha_url: str = "http://homeassistant.local:8123"
     ha_token: str = ""
     ha_notify_service: str = ""
+    ha_max_inflight: int = 8  # cap on concurrent requests to HA's API
 
     # Twilio SMS
     twilio_account_sid: str = ""
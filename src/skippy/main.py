@@ -8,6 +8,7 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname
 
 from fastapi import FastAPI
 from langchain_core.messages import HumanMessage
+from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
 from pydantic import BaseModel
 
@@ -19,6 +20,7 @@ from skippy.db_init import initialize_schema
 from skippy.db_utils import set_db_pool
 from skippy.scheduler import start_scheduler, stop_scheduler
 from skippy.telegram import start_telegram, stop_telegram
+from skippy.tools.home_assistant import close_ha_client, drain_notifications
 from skippy.web.home import router as home_router
 from skippy.web.memories import router as memories_router
 from skippy.web.people import router as people_router
@@ -107,11 +109,19 @@ async def lifespan(app: FastAPI):
     # Make the pool globally available for background tasks and tools
     set_db_pool(app.state.pool)
     await initialize_schema()
-    checkpointer_cm = AsyncPostgresSaver.from_conn_string(settings.database_url)
-    checkpointer = await checkpointer_cm.__aenter__()
+    # The checkpointer gets its own pool: it needs dict rows and autocommit,
+    # and a single connection would serialize checkpoint I/O across conversations
+    app.state.checkpoint_pool = AsyncConnectionPool(
+        conninfo=settings.database_url,
+        min_size=1,
+        max_size=5,
+        open=False,
+        kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+    )
+    await app.state.checkpoint_pool.open()
+    checkpointer = AsyncPostgresSaver(app.state.checkpoint_pool)
     await checkpointer.setup()
     app.state.checkpointer = checkpointer
-    app.state._checkpointer_cm = checkpointer_cm
     # Build agent graph with all tools (voice/chat/telegram use full access)
     app.state.graph = await build_graph(checkpointer, tool_modules=None)
     logger.info("Skippy agent ready")
@@ -120,8 +130,10 @@ async def lifespan(app: FastAPI):
     yield
     await stop_telegram(app)
     await stop_scheduler(app)
+    await drain_notifications()
+    await close_ha_client()
     # Shutdown: clean up checkpointer and pool
-    await app.state._checkpointer_cm.__aexit__(None, None, None)
+    await app.state.checkpoint_pool.close()
     await app.state.pool.close()
 
 
@@ -1,15 +1,30 @@
 import json
 import logging
+import re
 
 from openai import AsyncOpenAI
 from skippy.db_utils import get_db_connection
 
 from skippy.agent.prompts import MEMORY_EVALUATION_PROMPT, PERSON_EXTRACTION_PROMPT
 from skippy.config import settings
+from skippy.tools.people import _resolve_person_identity, _update_person_importance
 from skippy.utils.activity_logger import log_activity
 
 logger = logging.getLogger("skippy")
 
+# Heuristic: Extract first capitalized name before common verbs/patterns
+# Matches: "Summer enjoys..." → "Summer"
+#          "Harper's birthday..." → "Harper"
+#          "Jenny Spaldin is..." → "Jenny Spaldin"
+_PERSON_NAME_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:is|has|lives|works|goes|likes|dislikes|enjoys|prefers)',
+        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\'s\s+',  # Possessive form
+        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:born|married|knows|met)',
+    )
+)
+
 
 async def evaluate_and_store_safe(
     conversation_history: list[dict],
@@ -207,8 +222,6 @@ async def _extract_and_store_person(
     5. Otherwise → create new person
     6. After upsert: increment importance_score
     """
-    from skippy.tools.people import _resolve_person_identity, _update_person_importance
-
     try:
         response = await client.responses.create(
             model=settings.llm_model,
@@ -382,22 +395,9 @@ async def _extract_person_id_from_content(content: str, user_id: str) -> int | N
     Returns:
         person_id if high-confidence match found, None otherwise
     """
-    import re
-    from skippy.tools.people import _resolve_person_identity
-
-    # Heuristic: Extract first capitalized name before common verbs/patterns
-    # Matches: "Summer enjoys..." → "Summer"
-    #          "Harper's birthday..." → "Harper"
-    #          "Jenny Spaldin is..." → "Jenny Spaldin"
-    patterns = [
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:is|has|lives|works|goes|likes|dislikes|enjoys|prefers)',
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\'s\s+',  # Possessive form
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:born|married|knows|met)',
-    ]
-
     extracted_name = None
-    for pattern in patterns:
-        match = re.match(pattern, content)
+    for pattern in _PERSON_NAME_PATTERNS:
+        match = pattern.match(content)
         if match:
             extracted_name = match.group(1)
             break
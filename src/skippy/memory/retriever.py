@@ -2,6 +2,8 @@ import json
 import logging
 
 from openai import AsyncOpenAI
+from psycopg.rows import dict_row
+
 from skippy.db_utils import get_db_connection
 
 from skippy.config import settings
@@ -55,18 +57,21 @@ async def retrieve_memories(
 
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(sql, (embedding_str, user_id, threshold, limit))
+            async with conn.cursor(row_factory=dict_row) as cur:
+                # Runs on every turn; prepare on first use per pooled connection rather
+                # than after psycopg's default threshold of 5 executions
+                await cur.execute(
+                    sql, (embedding_str, user_id, threshold, limit), prepare=True
+                )
                 rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
 
                 return [
                     {
-                        "memory_id": row[columns.index("memory_id")],
-                        "content": row[columns.index("content")],
-                        "category": row[columns.index("category")],
-                        "confidence": row[columns.index("confidence_score")],
-                        "similarity": float(row[columns.index("similarity")]),
+                        "memory_id": row["memory_id"],
+                        "content": row["content"],
+                        "category": row["category"],
+                        "confidence": row["confidence_score"],
+                        "similarity": float(row["similarity"]),
                     }
                     for row in rows
                 ]
@@ -9,6 +9,7 @@ from langchain_core.tools import tool
 
 from skippy.config import settings
 from skippy.tools.google_auth import get_google_user_service
+from skippy.tools.people import _resolve_person_identity, _update_person_importance
 from skippy.utils.activity_logger import log_activity
 
 logger = logging.getLogger("skippy")
@@ -69,12 +70,6 @@ def _normalize_phone(phone: str) -> str:
     return re.sub(r'\D', '', phone) if phone else ""
 
 
-async def _update_person_importance(person_id: int) -> None:
-    """Update importance score for a person."""
-    from skippy.tools.people import _update_person_importance
-    await _update_person_importance(person_id)
-
-
 async def sync_google_contacts_to_people() -> dict:
     """Fetch all Google Contacts and upsert into the people table.
 
@@ -87,9 +82,6 @@ async def sync_google_contacts_to_people() -> dict:
 
     Returns dict with keys: synced, skipped, errors, auto_merged, suggestions.
     """
-    from rapidfuzz import fuzz
-    from skippy.tools.people import _resolve_person_identity
-
     service = get_google_user_service("people", "v1")
 
     # Paginate through all contacts
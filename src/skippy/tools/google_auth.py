@@ -91,3 +91,17 @@ def get_google_user_service(api: str, version: str):
     _services[cache_key] = service
     logger.info("Google %s %s service initialized", api, version)
     return service
+
+
+def new_authorized_http(credentials):
+    """Build a fresh authorized Http for executing requests in a worker thread.
+
+    httplib2 connections are not thread-safe, so requests run concurrently via
+    asyncio.to_thread must not share a service's default Http. build_http()
+    applies the same default timeout and redirect handling as the service's own
+    Http, so a stalled socket can't hang the thread.
+    """
+    import google_auth_httplib2
+    from googleapiclient.http import build_http
+
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
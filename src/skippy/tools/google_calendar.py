@@ -1,18 +1,36 @@
 """Google Calendar tools for Skippy — full read/write calendar access."""
 
+import asyncio
 import logging
-import re
-from datetime import datetime, timedelta, timezone
-from zoneinfo import ZoneInfo
+import time
+from datetime import date, datetime, timedelta, timezone
 
 from langchain_core.tools import tool
 
 from skippy.config import settings
+from skippy.tools.google_auth import new_authorized_http
 
 logger = logging.getLogger("skippy")
 
-# Module-level calendar service, initialized lazily
+# Retries googleapiclient applies itself (backoff on 429/5xx) for read calls
+_READ_RETRIES = 2
+
+# Module-level calendar service and its credentials, each initialized lazily
 _service = None
+_credentials = None
+
+
+def _get_calendar_credentials():
+    """Load and cache the service account credentials for the calendar."""
+    global _credentials
+    if _credentials is None:
+        from google.oauth2 import service_account
+
+        _credentials = service_account.Credentials.from_service_account_file(
+            settings.google_service_account_json,
+            scopes=["https://www.googleapis.com/auth/calendar"],
+        )
+    return _credentials
 
 
 def _get_calendar_service():
@@ -21,17 +39,58 @@ def _get_calendar_service():
     if _service is not None:
         return _service
 
-    from google.oauth2 import service_account
     from googleapiclient.discovery import build
 
-    credentials = service_account.Credentials.from_service_account_file(
-        settings.google_service_account_json,
-        scopes=["https://www.googleapis.com/auth/calendar"],
+    _service = build(
+        "calendar", "v3", credentials=_get_calendar_credentials(), model=_orjson_model()
     )
-    _service = build("calendar", "v3", credentials=credentials)
     return _service
 
 
+def _orjson_model():
+    """Build a googleapiclient JsonModel that decodes responses with orjson.
+
+    Scoped to the calendar service so the stdlib json module is left untouched.
+    Anything orjson rejects falls through to the stock decoder.
+    """
+    import orjson
+    from googleapiclient.model import JsonModel
+
+    class _OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+    return _OrjsonModel()
+
+
+_WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _clock_from_iso(value: str) -> str:
+    """Format the time of an RFC 3339 dateTime as 'HH:MM AM/PM'.
+
+    Google returns 'YYYY-MM-DDTHH:MM:SS±HH:MM', so the clock is sliced out
+    directly; anything else goes through a full ISO parse.
+    """
+    if len(value) < 16 or value[10] != "T" or value[13] != ":":
+        return datetime.fromisoformat(value).strftime("%I:%M %p")
+    hour = int(value[11:13])
+    return f"{hour % 12 or 12:02d}:{value[14:16]} {'AM' if hour < 12 else 'PM'}"
+
+
+def _day_from_iso(value: str) -> str:
+    """Format the date prefix of an ISO date/dateTime as 'Sun Feb 15'."""
+    d = date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    return f"{_WEEKDAY_ABBR[d.weekday()]} {_MONTH_ABBR[d.month - 1]} {d.day:02d}"
+
+
 def _format_event(event: dict) -> str:
     """Format a single calendar event into a readable string."""
     summary = event.get("summary", "(no title)")
@@ -41,8 +100,8 @@ def _format_event(event: dict) -> str:
     end = event.get("end", {})
 
     if "dateTime" in start:
-        start_str = datetime.fromisoformat(start["dateTime"]).strftime("%I:%M %p")
-        end_str = datetime.fromisoformat(end["dateTime"]).strftime("%I:%M %p")
+        start_str = _clock_from_iso(start["dateTime"])
+        end_str = _clock_from_iso(end["dateTime"])
         time_str = f"{start_str} - {end_str}"
         # Include full ISO with timezone so reminder tools can store it accurately
         iso_hint = f" [start_iso: {start['dateTime']}]"
@@ -64,14 +123,13 @@ def _format_event_with_date(event: dict) -> str:
     end = event.get("end", {})
 
     if "dateTime" in start:
-        dt = datetime.fromisoformat(start["dateTime"])
-        date_str = dt.strftime("%a %b %d")
-        start_str = dt.strftime("%I:%M %p")
-        end_str = datetime.fromisoformat(end["dateTime"]).strftime("%I:%M %p")
+        date_str = _day_from_iso(start["dateTime"])
+        start_str = _clock_from_iso(start["dateTime"])
+        end_str = _clock_from_iso(end["dateTime"])
         time_str = f"{date_str}, {start_str} - {end_str}"
         iso_hint = f" [start_iso: {start['dateTime']}]"
     else:
-        date_str = datetime.fromisoformat(start["date"]).strftime("%a %b %d")
+        date_str = _day_from_iso(start["date"])
         time_str = f"{date_str} (All day)"
         iso_hint = f" [start_iso: {start.get('date', '')}]"
 
@@ -83,31 +141,75 @@ def _format_event_with_date(event: dict) -> str:
 
 # --- Read tools ---
 
+# (epoch second, datetime, ISO string) shared by read tools within the same second
+_now_cache: tuple[int, datetime, str] | None = None
+
+
+def _utc_now() -> tuple[datetime, str]:
+    """Return the current UTC time and its ISO string, reused within one second.
+
+    The agent often fires several calendar reads in the same planning step;
+    the first read in a given second formats the time and later reads in
+    that second reuse it, so their timeMin can lag the wall clock by <1s.
+    """
+    global _now_cache
+    second = int(time.time())
+    if _now_cache is None or _now_cache[0] != second:
+        now = datetime.now(timezone.utc)
+        _now_cache = (second, now, now.isoformat())
+    return _now_cache[1], _now_cache[2]
+
+
+def _todays_events_text(service, http=None) -> str:
+    """Fetch today's events and format them for the LLM."""
+    now, now_iso = _utc_now()
+    # Midnight-to-midnight UTC bounds, built from the cached date strings
+    tomorrow = (now.date() + timedelta(days=1)).isoformat()
+
+    result = service.events().list(
+        calendarId=settings.google_calendar_id,
+        timeMin=f"{now_iso[:10]}T00:00:00+00:00",
+        timeMax=f"{tomorrow}T00:00:00+00:00",
+        singleEvents=True,
+        orderBy="startTime",
+    ).execute(http=http, num_retries=_READ_RETRIES)
+
+    events = result.get("items", [])
+    if not events:
+        return "No events on the calendar today."
+
+    body = "\n".join(_format_event(e) for e in events)
+    return f"Today's events ({len(events)}):\n{body}"
+
+
+def _upcoming_events_text(service, days: int, http=None) -> str:
+    """Fetch events for the next N days and format them for the LLM."""
+    now, now_iso = _utc_now()
+    end = now + timedelta(days=days)
+
+    result = service.events().list(
+        calendarId=settings.google_calendar_id,
+        timeMin=now_iso,
+        timeMax=end.isoformat(),
+        singleEvents=True,
+        orderBy="startTime",
+        maxResults=25,
+    ).execute(http=http, num_retries=_READ_RETRIES)
+
+    events = result.get("items", [])
+    if not events:
+        return f"No events in the next {days} days."
+
+    body = "\n".join(_format_event_with_date(e) for e in events)
+    return f"Upcoming events (next {days} days, {len(events)} found):\n{body}"
+
 
 @tool
 def get_todays_events() -> str:
     """Get all events on today's calendar. Use this when the user asks what's
     on their schedule today, what meetings they have, or what they're doing today."""
     try:
-        service = _get_calendar_service()
-        now = datetime.now(timezone.utc)
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
-
-        result = service.events().list(
-            calendarId=settings.google_calendar_id,
-            timeMin=start_of_day.isoformat(),
-            timeMax=end_of_day.isoformat(),
-            singleEvents=True,
-            orderBy="startTime",
-        ).execute()
-
-        events = result.get("items", [])
-        if not events:
-            return "No events on the calendar today."
-
-        lines = [_format_event(e) for e in events]
-        return f"Today's events ({len(events)}):\n" + "\n".join(lines)
+        return _todays_events_text(_get_calendar_service())
     except Exception as e:
         logger.error("Failed to fetch today's events: %s", e)
         return f"Error reading calendar: {e}"
@@ -120,27 +222,39 @@ def get_upcoming_events(days: int = 7) -> str:
     for the next few days. The days parameter controls how far ahead to look
     (defaults to 7)."""
     try:
-        service = _get_calendar_service()
-        now = datetime.now(timezone.utc)
-        end = now + timedelta(days=days)
+        return _upcoming_events_text(_get_calendar_service(), days)
+    except Exception as e:
+        logger.error("Failed to fetch upcoming events: %s", e)
+        return f"Error reading calendar: {e}"
 
-        result = service.events().list(
-            calendarId=settings.google_calendar_id,
-            timeMin=now.isoformat(),
-            timeMax=end.isoformat(),
-            singleEvents=True,
-            orderBy="startTime",
-            maxResults=25,
-        ).execute()
 
-        events = result.get("items", [])
-        if not events:
-            return f"No events in the next {days} days."
+def _on_own_http(fetch, *args) -> str:
+    """Run an events fetch with a fresh Http (blocking; run in a worker thread).
 
-        lines = [_format_event_with_date(e) for e in events]
-        return f"Upcoming events (next {days} days, {len(events)} found):\n" + "\n".join(lines)
+    Service and credential setup happen here too, since both read files.
+    """
+    service = _get_calendar_service()
+    return fetch(service, *args, http=new_authorized_http(_get_calendar_credentials()))
+
+
+@tool
+async def get_calendar_overview(days: int = 7) -> str:
+    """Get today's events and the upcoming events for the next N days in one
+    call. Use this when the user asks about both today and the days ahead,
+    e.g. "what's on today and what's coming up this week?" (days defaults to 7)."""
+    try:
+        # Both list requests run concurrently, each in its own thread on its own
+        # connection; the reads already retry inside execute(), so only bound the
+        # total time here
+        today, upcoming = await asyncio.gather(
+            asyncio.wait_for(asyncio.to_thread(_on_own_http, _todays_events_text), 30),
+            asyncio.wait_for(
+                asyncio.to_thread(_on_own_http, _upcoming_events_text, days), 30
+            ),
+        )
+        return f"{today}\n\n{upcoming}"
     except Exception as e:
-        logger.error("Failed to fetch upcoming events: %s", e)
+        logger.error("Failed to fetch calendar overview: %s", e)
         return f"Error reading calendar: {e}"
 
 
@@ -150,25 +264,25 @@ def search_events(query: str) -> str:
     specific event, meeting, or appointment by name. Searches the next 30 days."""
     try:
         service = _get_calendar_service()
-        now = datetime.now(timezone.utc)
+        now, now_iso = _utc_now()
         end = now + timedelta(days=30)
 
         result = service.events().list(
             calendarId=settings.google_calendar_id,
-            timeMin=now.isoformat(),
+            timeMin=now_iso,
             timeMax=end.isoformat(),
             q=query,
             singleEvents=True,
             orderBy="startTime",
             maxResults=10,
-        ).execute()
+        ).execute(num_retries=_READ_RETRIES)
 
         events = result.get("items", [])
         if not events:
             return f'No events matching "{query}" in the next 30 days.'
 
-        lines = [_format_event_with_date(e) for e in events]
-        return f'Events matching "{query}" ({len(events)} found):\n' + "\n".join(lines)
+        body = "\n".join(_format_event_with_date(e) for e in events)
+        return f'Events matching "{query}" ({len(events)} found):\n{body}'
     except Exception as e:
         logger.error("Failed to search events: %s", e)
         return f"Error searching calendar: {e}"
@@ -176,6 +290,19 @@ def search_events(query: str) -> str:
 
 # --- Date/time helpers ---
 
+# Full day names and RFC 5545 abbreviations, both keyed lowercase → BYDAY code
+_DAYS_MAP = {
+    "monday": "MO", "mo": "MO",
+    "tuesday": "TU", "tu": "TU",
+    "wednesday": "WE", "we": "WE",
+    "thursday": "TH", "th": "TH",
+    "friday": "FR", "fr": "FR",
+    "saturday": "SA", "sa": "SA",
+    "sunday": "SU", "su": "SU",
+}
+
+_VALID_FREQUENCIES = frozenset({"DAILY", "WEEKLY", "MONTHLY", "YEARLY"})
+
 
 def _resolve_datetime(date_str: str, time_str: str) -> datetime:
     """Resolve a date and time string into a timezone-aware datetime.
@@ -183,6 +310,10 @@ def _resolve_datetime(date_str: str, time_str: str) -> datetime:
     date_str: 'today', 'tomorrow', or 'YYYY-MM-DD'
     time_str: '10pm', '10:00 PM', '22:00', '14:30', etc.
     """
+    # Only the write tools need these; keep them off the read-only import path
+    import re
+    from zoneinfo import ZoneInfo
+
     tz = ZoneInfo(settings.timezone)
     now = datetime.now(tz)
 
@@ -245,8 +376,8 @@ def _build_rrule(
         ValueError: If frequency is unknown.
     """
     # Normalize frequency to uppercase
-    freq_upper = frequency.lower().strip().upper()
-    if freq_upper not in ("DAILY", "WEEKLY", "MONTHLY", "YEARLY"):
+    freq_upper = frequency.strip().upper()
+    if freq_upper not in _VALID_FREQUENCIES:
         raise ValueError(
             f"Invalid frequency '{frequency}'. Must be: daily, weekly, monthly, or yearly"
         )
@@ -259,29 +390,12 @@ def _build_rrule(
 
     # Normalize days_of_week if provided (for weekly events)
     if days_of_week:
-        days_map = {
-            "monday": "MO",
-            "tuesday": "TU",
-            "wednesday": "WE",
-            "thursday": "TH",
-            "friday": "FR",
-            "saturday": "SA",
-            "sunday": "SU",
-        }
-
-        # Split by comma and normalize each day
-        day_list = [d.strip() for d in days_of_week.split(",")]
         normalized_days = []
-        for day in day_list:
-            day_lower = day.lower()
-            if day_lower in days_map:
-                # Full name like "Monday" → "MO"
-                normalized_days.append(days_map[day_lower])
-            elif day.upper() in ("MO", "TU", "WE", "TH", "FR", "SA", "SU"):
-                # Already abbreviated, keep as-is
-                normalized_days.append(day.upper())
-            else:
-                raise ValueError(f"Unrecognized day: '{day}'")
+        for day in days_of_week.split(","):
+            try:
+                normalized_days.append(_DAYS_MAP[day.strip().lower()])
+            except KeyError:
+                raise ValueError(f"Unrecognized day: '{day.strip()}'") from None
 
         parts.append(f"BYDAY={','.join(normalized_days)}")
 
@@ -542,6 +656,7 @@ def get_tools() -> list:
         return [
             get_todays_events,
             get_upcoming_events,
+            get_calendar_overview,
             search_events,
             create_event,
             create_recurring_event,
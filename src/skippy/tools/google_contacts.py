@@ -1,14 +1,27 @@
 """Google Contacts tools for Skippy — search, view, create, and update contacts."""
 
+import asyncio
 import logging
 
 from langchain_core.tools import tool
 
 from skippy.config import settings
-from skippy.tools.google_auth import get_google_user_service
+from skippy.tools.google_auth import (
+    _get_credentials,
+    get_google_user_service,
+    new_authorized_http,
+)
 
 logger = logging.getLogger("skippy")
 
+# People API field masks
+_SEARCH_READ_MASK = "names,emailAddresses,phoneNumbers,organizations,addresses,birthdays,biographies"
+_DETAIL_PERSON_FIELDS = _SEARCH_READ_MASK + ",urls"
+_UPDATE_FETCH_FIELDS = "names,emailAddresses,phoneNumbers,organizations,biographies"
+
+# Retries googleapiclient applies itself (backoff on 429/5xx) for read calls
+_READ_RETRIES = 2
+
 
 def _get_people_service():
     return get_google_user_service("people", "v1")
@@ -29,12 +42,9 @@ def _format_contact(person: dict) -> str:
     resource = person.get("resourceName", "")
     lines = [f"**{name}** [resource: {resource}]"]
 
-    for e in emails:
-        lines.append(f"  Email: {e.get('value', '?')} ({e.get('type', '')})")
-    for p in phones:
-        lines.append(f"  Phone: {p.get('value', '?')} ({p.get('type', '')})")
-    for a in addresses:
-        lines.append(f"  Address: {a.get('formattedValue', '?')}")
+    lines.extend(f"  Email: {e.get('value', '?')} ({e.get('type', '')})" for e in emails)
+    lines.extend(f"  Phone: {p.get('value', '?')} ({p.get('type', '')})" for p in phones)
+    lines.extend(f"  Address: {a.get('formattedValue', '?')}" for a in addresses)
     for o in orgs:
         title = o.get("title", "")
         company = o.get("name", "")
@@ -44,12 +54,10 @@ def _format_contact(person: dict) -> str:
             lines.append(f"  Work: {company}")
     for b in bdays:
         date = b.get("date", {})
+        year = date.get("year")
         bday_str = f"{date.get('month', '?')}/{date.get('day', '?')}"
-        if date.get("year"):
-            bday_str = f"{date['year']}-{bday_str}"
-        lines.append(f"  Birthday: {bday_str}")
-    for n in notes:
-        lines.append(f"  Notes: {n.get('value', '')[:200]}")
+        lines.append(f"  Birthday: {year}-{bday_str}" if year else f"  Birthday: {bday_str}")
+    lines.extend(f"  Notes: {n.get('value', '')[:200]}" for n in notes)
 
     return "\n".join(lines)
 
@@ -67,9 +75,9 @@ def search_contacts(query: str) -> str:
 
         results = service.people().searchContacts(
             query=query,
-            readMask="names,emailAddresses,phoneNumbers,organizations,addresses,birthdays,biographies",
+            readMask=_SEARCH_READ_MASK,
             pageSize=10,
-        ).execute()
+        ).execute(num_retries=_READ_RETRIES)
 
         contacts = results.get("results", [])
         if not contacts:
@@ -100,8 +108,8 @@ def get_contact_details(resource_name: str) -> str:
 
         person = service.people().get(
             resourceName=resource_name,
-            personFields="names,emailAddresses,phoneNumbers,organizations,addresses,birthdays,biographies,urls",
-        ).execute()
+            personFields=_DETAIL_PERSON_FIELDS,
+        ).execute(num_retries=_READ_RETRIES)
 
         return _format_contact(person)
     except Exception as e:
@@ -109,6 +117,35 @@ def get_contact_details(resource_name: str) -> str:
         return f"Error getting contact: {e}"
 
 
+# (argument, People API field, value builder) for the simple contact fields
+_PERSON_FIELDS = (
+    ("name", "names", lambda v: [{"givenName": v}]),
+    ("email", "emailAddresses", lambda v: [{"value": v}]),
+    ("phone", "phoneNumbers", lambda v: [{"value": v}]),
+    ("company", "organizations", lambda v: [{"name": v}]),
+    ("notes", "biographies", lambda v: [{"value": v, "contentType": "TEXT_PLAIN"}]),
+)
+
+
+def _person_fields(**values: str) -> dict:
+    """Map non-empty contact fields to People API body entries, keyed by field name."""
+    return {key: build(values[arg]) for arg, key, build in _PERSON_FIELDS if values.get(arg)}
+
+
+def _build_person_body(
+    name: str,
+    email: str = "",
+    phone: str = "",
+    company: str = "",
+    notes: str = "",
+) -> dict:
+    """Build a People API person body from the simple contact fields."""
+    return {
+        "names": [{"givenName": name}],
+        **_person_fields(email=email, phone=phone, company=company, notes=notes),
+    }
+
+
 @tool
 def create_contact(
     name: str,
@@ -130,18 +167,7 @@ def create_contact(
     try:
         service = _get_people_service()
 
-        body: dict = {
-            "names": [{"givenName": name}],
-        }
-        if email:
-            body["emailAddresses"] = [{"value": email}]
-        if phone:
-            body["phoneNumbers"] = [{"value": phone}]
-        if company:
-            body["organizations"] = [{"name": company}]
-        if notes:
-            body["biographies"] = [{"value": notes, "contentType": "TEXT_PLAIN"}]
-
+        body = _build_person_body(name, email, phone, company, notes)
         result = service.people().createContact(body=body).execute()
         resource = result.get("resourceName", "unknown")
         logger.info("Contact created: %s (%s)", name, resource)
@@ -151,8 +177,89 @@ def create_contact(
         return f"Error creating contact: {e}"
 
 
+# People API limit for batchCreateContacts
+_BATCH_CREATE_LIMIT = 200
+
+
 @tool
-def update_contact(
+def create_contacts_bulk(contacts: list[dict]) -> str:
+    """Create several Google Contacts in a single request. Use this instead of
+    calling create_contact repeatedly when the user asks to add more than one
+    contact at once.
+
+    Args:
+        contacts: List of contacts, each a dict with a required "name" and
+            optional "email", "phone", "company", and "notes" keys.
+    """
+    try:
+        if not contacts:
+            return "No contacts to create."
+        missing = [i for i, c in enumerate(contacts) if not c.get("name")]
+        if missing:
+            return f"Every contact needs a name (missing at positions {missing})."
+
+        service = _get_people_service()
+
+        created = []
+        for i in range(0, len(contacts), _BATCH_CREATE_LIMIT):
+            chunk = contacts[i : i + _BATCH_CREATE_LIMIT]
+            result = service.people().batchCreateContacts(
+                body={
+                    "contacts": [
+                        {
+                            "contactPerson": _build_person_body(
+                                c["name"],
+                                c.get("email", ""),
+                                c.get("phone", ""),
+                                c.get("company", ""),
+                                c.get("notes", ""),
+                            )
+                        }
+                        for c in chunk
+                    ],
+                    "readMask": "names",
+                }
+            ).execute()
+            created.extend(result.get("createdPeople", []))
+
+        lines = []
+        for entry in created:
+            person = entry.get("person", {})
+            names = person.get("names", [])
+            name = names[0].get("displayName", "(no name)") if names else "(no name)"
+            lines.append(f"- {name} (resource: {person.get('resourceName', 'unknown')})")
+
+        logger.info("Bulk contact create: %d requested, %d created", len(contacts), len(created))
+        return f"Created {len(created)} of {len(contacts)} contacts:\n" + "\n".join(lines)
+    except Exception as e:
+        logger.error("Failed to bulk create contacts: %s", e)
+        return f"Error creating contacts: {e}"
+
+
+def _apply_contact_update(resource_name: str, updates: dict) -> dict:
+    """Fetch a contact's etag and apply `updates` (blocking; run in a thread).
+
+    Returns the contact as it was before the update.
+    """
+    service = _get_people_service()
+    # Own connection so parallel update_contact calls don't share httplib2 state
+    http = new_authorized_http(_get_credentials())
+
+    current = service.people().get(
+        resourceName=resource_name,
+        personFields=_UPDATE_FETCH_FIELDS,
+    ).execute(http=http, num_retries=_READ_RETRIES)
+
+    service.people().updateContact(
+        resourceName=resource_name,
+        updatePersonFields=",".join(updates),
+        body={"etag": current.get("etag"), **updates},
+    ).execute(http=http)
+    return current
+
+
+@tool
+async def update_contact(
     resource_name: str,
     name: str = "",
     email: str = "",
@@ -172,43 +279,17 @@ def update_contact(
         company: New company (leave empty to keep current).
         notes: New notes (leave empty to keep current).
     """
-    try:
-        service = _get_people_service()
+    updates = _person_fields(name=name, email=email, phone=phone, company=company, notes=notes)
+    if not updates:
+        return "No fields to update — provide at least one field to change."
 
-        # Fetch current contact to get etag and current data
-        current = service.people().get(
-            resourceName=resource_name,
-            personFields="names,emailAddresses,phoneNumbers,organizations,biographies",
-        ).execute()
-
-        etag = current.get("etag")
-        update_fields = []
-        body: dict = {"etag": etag}
-
-        if name:
-            body["names"] = [{"givenName": name}]
-            update_fields.append("names")
-        if email:
-            body["emailAddresses"] = [{"value": email}]
-            update_fields.append("emailAddresses")
-        if phone:
-            body["phoneNumbers"] = [{"value": phone}]
-            update_fields.append("phoneNumbers")
-        if company:
-            body["organizations"] = [{"name": company}]
-            update_fields.append("organizations")
-        if notes:
-            body["biographies"] = [{"value": notes, "contentType": "TEXT_PLAIN"}]
-            update_fields.append("biographies")
-
-        if not update_fields:
-            return "No fields to update — provide at least one field to change."
-
-        result = service.people().updateContact(
-            resourceName=resource_name,
-            updatePersonFields=",".join(update_fields),
-            body=body,
-        ).execute()
+    try:
+        # One worker thread for the whole update: credential refresh, the etag GET
+        # and the write all block. Not retried from here — a timed-out thread may
+        # still complete the write; the GET retries inside execute().
+        current = await asyncio.wait_for(
+            asyncio.to_thread(_apply_contact_update, resource_name, updates), timeout=40
+        )
 
         updated_name = name or (current.get("names", [{}])[0].get("displayName", resource_name))
         logger.info("Contact updated: %s", resource_name)
@@ -221,5 +302,11 @@ def update_contact(
 def get_tools() -> list:
     """Return Google Contacts tools if OAuth2 credentials are configured."""
     if settings.google_oauth_token_json:
-        return [search_contacts, get_contact_details, create_contact, update_contact]
+        return [
+            search_contacts,
+            get_contact_details,
+            create_contact,
+            create_contacts_bulk,
+            update_contact,
+        ]
     return []
@@ -8,17 +8,32 @@ Note: Device control functionality has been moved to Jarvis AI.
 This module now focuses exclusively on communication/notification delivery.
 """
 
+import asyncio
 import logging
 
 import httpx
 from langchain_core.tools import tool
+from twilio.base.exceptions import TwilioException
 
 from skippy.config import settings
 from skippy.utils.activity_logger import log_activity
 from skippy.utils.quiet_hours import is_quiet_time, queue_notification
+from skippy.utils.retry import is_unsent, with_timeout_and_retry
 
 logger = logging.getLogger("skippy")
 
+# Shared HA client, created lazily on first use and closed at app shutdown
+_ha_client: httpx.AsyncClient | None = None
+
+# Twilio REST client, built on first SMS so its HTTP session is reused
+_twilio_client = None
+
+# Cap on exception text echoed back to the agent (HA 5xx bodies can be whole HTML pages)
+_MAX_ERROR_CHARS = 200
+
+# In-flight push deliveries; holding references keeps the tasks from being GC'd
+_pending_deliveries: set[asyncio.Task] = set()
+
 
 # ============================================================================
 # Helper Functions (Internal, not exposed as tools)
@@ -33,17 +48,72 @@ def _get_ha_headers() -> dict:
     }
 
 
+def _format_error(e: BaseException) -> str:
+    """Stringify an exception for a tool result, truncated to _MAX_ERROR_CHARS."""
+    text = str(e)
+    if len(text) > _MAX_ERROR_CHARS:
+        return text[:_MAX_ERROR_CHARS] + "…"
+    return text
+
+
+def _get_ha_client() -> httpx.AsyncClient:
+    """Return the shared HA AsyncClient, creating it on first use."""
+    global _ha_client
+    if _ha_client is None or _ha_client.is_closed:
+        _ha_client = httpx.AsyncClient(
+            base_url=settings.ha_url,
+            headers=_get_ha_headers(),
+            # Fail fast on connect while HA restarts, so retries start sooner
+            timeout=httpx.Timeout(10, connect=2),
+            # Notifications are sporadic; hold idle connections longer than httpx's 5s default.
+            # max_connections queues bursts in the pool rather than flooding HA's event loop.
+            limits=httpx.Limits(
+                max_connections=settings.ha_max_inflight,
+                max_keepalive_connections=5,
+                keepalive_expiry=60,
+            ),
+        )
+    return _ha_client
+
+
+def _on_delivery_done(task: asyncio.Task) -> None:
+    """Forget a finished push delivery, logging anything it didn't handle itself."""
+    _pending_deliveries.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("HA notification task failed", exc_info=task.exception())
+
+
+async def drain_notifications(timeout: float = 10) -> None:
+    """Wait for in-flight push deliveries (called by main.py before shutdown)."""
+    if _pending_deliveries:
+        await asyncio.wait(set(_pending_deliveries), timeout=timeout)
+
+
+async def close_ha_client() -> None:
+    """Close the shared HA client (called by main.py at shutdown)."""
+    global _ha_client
+    if _ha_client is not None:
+        await _ha_client.aclose()
+        _ha_client = None
+
+
 async def _deliver_ha_push(message: str, title: str = "Skippy") -> str:
     """Send an HA push notification immediately (no quiet-hours check)."""
     try:
-        url = f"{settings.ha_url}/api/services/notify/{settings.ha_notify_service}"
-        headers = _get_ha_headers()
         payload = {"message": message, "title": title}
 
-        response = httpx.post(url, json=payload, headers=headers, timeout=10)
-        response.raise_for_status()
+        async def _post() -> httpx.Response:
+            response = await _get_ha_client().post(
+                f"/api/services/notify/{settings.ha_notify_service}", json=payload
+            )
+            response.raise_for_status()
+            return response
+
+        # Only retry failures before the request reached HA; after a read timeout
+        # or 5xx the push may already be on the phone, and a retry would duplicate it
+        await with_timeout_and_retry(_post, timeout=15, retry_if=is_unsent)
 
-        logger.info("Notification sent: title='%s', message='%s'", title, message)
+        logger.debug("Notification sent: title='%s', message='%s'", title, message)
         await log_activity(
             activity_type="notification_sent",
             entity_type="system",
@@ -54,26 +124,41 @@ async def _deliver_ha_push(message: str, title: str = "Skippy") -> str:
         )
         return f"Notification sent successfully: '{title} - {message}'"
     except httpx.HTTPStatusError as e:
-        logger.error("HA notification failed (HTTP %s): %s", e.response.status_code, e)
-        return f"Failed to send notification (HTTP {e.response.status_code}): {e}"
-    except Exception as e:
-        logger.error("HA notification failed: %s", e)
-        return f"Failed to send notification: {e}"
+        error = _format_error(e)
+        logger.error("HA notification failed (HTTP %s): %s", e.response.status_code, error)
+        return f"Failed to send notification (HTTP {e.response.status_code}): {error}"
+    except (httpx.HTTPError, TimeoutError) as e:
+        error = _format_error(e)
+        logger.error("HA notification failed: %s", error)
+        return f"Failed to send notification: {error}"
+
+
+def _get_twilio_client():
+    """Build and cache the Twilio REST client."""
+    global _twilio_client
+    if _twilio_client is None:
+        from twilio.rest import Client
+
+        _twilio_client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
+    return _twilio_client
 
 
 async def _deliver_sms(message: str) -> str:
     """Send an SMS immediately (no quiet-hours check)."""
     try:
-        from twilio.rest import Client
-
-        client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
-        sms = client.messages.create(
+        # The Twilio SDK is synchronous; keep its HTTP round-trip off the event loop
+        # No retries: a send that timed out may still have been delivered
+        sms = await with_timeout_and_retry(
+            asyncio.to_thread,
+            _get_twilio_client().messages.create,
+            timeout=20,
+            retries=0,
             body=message,
             from_=settings.twilio_from_number,
             to=settings.twilio_to_number,
         )
 
-        logger.info("SMS sent: sid=%s to=%s", sms.sid, settings.twilio_to_number)
+        logger.debug("SMS sent: sid=%s to=%s", sms.sid, settings.twilio_to_number)
         await log_activity(
             activity_type="sms_sent",
             entity_type="system",
@@ -83,9 +168,12 @@ async def _deliver_sms(message: str) -> str:
             user_id="nolan",
         )
         return f"SMS sent successfully to {settings.twilio_to_number}: '{message}'"
-    except Exception as e:
-        logger.error("SMS failed: %s", e)
-        return f"Failed to send SMS: {e}"
+    # Twilio's transport errors come from requests, whose exceptions subclass OSError
+    # (as does the TimeoutError raised by wait_for)
+    except (TwilioException, OSError) as e:
+        error = _format_error(e)
+        logger.error("SMS failed: %s", error)
+        return f"Failed to send SMS: {error}"
 
 
 # ============================================================================
@@ -112,7 +200,11 @@ async def send_notification(
     """
     if not is_critical and is_quiet_time():
         return await queue_notification("ha_push", {"message": message, "title": title})
-    return await _deliver_ha_push(message, title)
+    # Deliver in the background; failures are logged, not reported to the agent
+    task = asyncio.create_task(_deliver_ha_push(message, title))
+    _pending_deliveries.add(task)
+    task.add_done_callback(_on_delivery_done)
+    return f"Notification queued for delivery: '{title} - {message}'"
 
 
 @tool
@@ -6,6 +6,7 @@ import math
 import re
 from datetime import datetime, timezone
 
+import orjson
 from skippy.db_utils import get_db_connection
 from langchain_core.tools import tool
 from rapidfuzz import fuzz, process
@@ -107,15 +108,29 @@ async def _resolve_person_identity(
                                 "suggestion": False,
                             }
 
-                # Step 2: Exact canonical_name match
+                # Steps 2-3: Exact canonical_name or alias match in one round trip,
+                # preferring a canonical_name hit. Alias comparison is case-insensitive,
+                # so it unnests in SQL rather than using aliases @> containment, which
+                # would compare case-sensitively.
                 await cur.execute(
                     """
-                    SELECT person_id, canonical_name
+                    SELECT person_id, canonical_name,
+                           LOWER(canonical_name) = %s AS name_match
                     FROM people
-                    WHERE user_id = %s AND LOWER(canonical_name) = %s
+                    WHERE user_id = %s
+                      AND (
+                          LOWER(canonical_name) = %s
+                          OR EXISTS (
+                              SELECT 1 FROM jsonb_array_elements_text(aliases) AS alias
+                              WHERE LOWER(alias) = %s
+                          )
+                      )
+                    ORDER BY name_match DESC, person_id
                     LIMIT 1
                     """,
-                    (user_id, query_lower),
+                    (query_lower, user_id, query_lower, query_lower),
+                    # Every person-taking tool resolves through here; skip re-planning
+                    prepare=True,
                 )
                 row = await cur.fetchone()
                 if row:
@@ -123,33 +138,10 @@ async def _resolve_person_identity(
                         "person_id": row[0],
                         "canonical_name": row[1],
                         "confidence": 100.0,
-                        "matched_field": "canonical_name",
+                        "matched_field": "canonical_name" if row[2] else "alias",
                         "suggestion": False,
                     }
 
-                # Step 3: Exact alias match
-                await cur.execute(
-                    """
-                    SELECT person_id, canonical_name, aliases
-                    FROM people
-                    WHERE user_id = %s AND aliases IS NOT NULL
-                    ORDER BY person_id
-                    """,
-                    (user_id,),
-                )
-                rows = await cur.fetchall()
-                for row in rows:
-                    aliases = row[2] or []
-                    for alias in aliases:
-                        if alias.lower() == query_lower:
-                            return {
-                                "person_id": row[0],
-                                "canonical_name": row[1],
-                                "confidence": 100.0,
-                                "matched_field": "alias",
-                                "suggestion": False,
-                            }
-
                 # Step 4: Fetch all people for fuzzy matching
                 await cur.execute(
                     """
@@ -167,50 +159,38 @@ async def _resolve_person_identity(
         raise ValueError(f"Database error during person lookup: {e}")
 
     # Step 5: Fuzzy match on canonical_name and aliases
-    best_match = None
-    best_score = 0
-    best_field = None
-
+    # Flatten names and aliases so rapidfuzz scores them all in one C-level pass;
+    # owners[i] records which person (and field) choices[i] came from.
+    choices: list[str] = []
+    owners: list[tuple[int, str, str]] = []
     for person_id, canonical_name, aliases in all_people:
-        # Check canonical_name (use token_set_ratio for better name matching)
-        score = fuzz.token_set_ratio(query_lower, canonical_name.lower())
-        if score > best_score:
-            best_score = score
-            best_match = (person_id, canonical_name)
-            best_field = "canonical_name"
-
-        # Check aliases
-        if aliases:
-            for alias in aliases:
-                score = fuzz.token_set_ratio(query_lower, alias.lower())
-                if score > best_score:
-                    best_score = score
-                    best_match = (person_id, canonical_name)
-                    best_field = "alias"
-
-    # Evaluate result
-    if best_score >= threshold:
-        # High confidence - auto-use
-        return {
-            "person_id": best_match[0],
-            "canonical_name": best_match[1],
-            "confidence": float(best_score),
-            "matched_field": best_field,
-            "suggestion": False,
-        }
-    elif best_score >= 70:
-        # Medium confidence - suggest
-        return {
-            "person_id": best_match[0],
-            "canonical_name": best_match[1],
-            "confidence": float(best_score),
-            "matched_field": best_field,
-            "suggestion": True,
-        }
-    else:
+        choices.append(canonical_name.lower())
+        owners.append((person_id, canonical_name, "canonical_name"))
+        for alias in aliases or ():
+            choices.append(alias.lower())
+            owners.append((person_id, canonical_name, "alias"))
+
+    # token_set_ratio for better name matching; ties go to the earliest choice.
+    # Nothing below the suggestion floor is usable, so let rapidfuzz prune it.
+    min_score = min(threshold, 70)
+    match = process.extractOne(
+        query_lower, choices, scorer=fuzz.token_set_ratio, score_cutoff=min_score
+    )
+    if match is None:
         raise ValueError(
-            f"No person found matching '{query}' (best match: {best_score}%)"
+            f"No person found matching '{query}' (no match scored {min_score}% or higher)"
         )
+    best_score = match[1]
+
+    # Evaluate result: >= threshold is auto-used, 70 up to threshold is a suggestion
+    person_id, canonical_name, matched_field = owners[match[2]]
+    return {
+        "person_id": person_id,
+        "canonical_name": canonical_name,
+        "confidence": float(best_score),
+        "matched_field": matched_field,
+        "suggestion": best_score < threshold,
+    }
 
 
 async def _update_person_importance(person_id: int) -> None:
@@ -1033,23 +1013,28 @@ async def find_duplicate_people(threshold: int = 70) -> str:
                                 processed.add(other_id)
                                 break
 
-            # Fuzzy match on names (use token_set_ratio for better name matching)
-            for other_id in people_data:
-                if other_id <= person_id or other_id in processed:
-                    continue
-
-                score = fuzz.token_set_ratio(
-                    people_data[person_id]["name"].lower(),
-                    people_data[other_id]["name"].lower()
-                )
-
-                if score >= threshold:
-                    cluster["members"].append({
-                        "person_id": other_id,
-                        "name": people_data[other_id]["name"],
-                        "confidence": float(score),
-                    })
-                    processed.add(other_id)
+            # Fuzzy match on names (use token_set_ratio for better name matching),
+            # scoring every remaining candidate in a single rapidfuzz call
+            candidates = {
+                other_id: data["name"].lower()
+                for other_id, data in people_data.items()
+                if other_id > person_id and other_id not in processed
+            }
+            matches = process.extract(
+                people_data[person_id]["name"].lower(),
+                candidates,
+                scorer=fuzz.token_set_ratio,
+                score_cutoff=threshold,
+                limit=None,
+            )
+            # extract() ranks by score; keep members in person_id order as before
+            for _, score, other_id in sorted(matches, key=lambda m: m[2]):
+                cluster["members"].append({
+                    "person_id": other_id,
+                    "name": people_data[other_id]["name"],
+                    "confidence": float(score),
+                })
+                processed.add(other_id)
 
             processed.add(person_id)
 
@@ -1058,7 +1043,7 @@ async def find_duplicate_people(threshold: int = 70) -> str:
 
         result = list(clusters.values())
         if result:
-            return json.dumps(result, indent=2)
+            return orjson.dumps(result).decode()
         else:
             return "No duplicate people detected."
 
@@ -1102,54 +1087,36 @@ async def search_people_fuzzy(query: str, limit: int = 10) -> str:
             best_score = 0
             matched_field = ""
 
-            # Check canonical name
-            score = fuzz.ratio(query_lower, canonical_name.lower())
-            if score > best_score:
-                best_score = score
-                matched_field = "canonical_name"
-
-            # Check aliases
-            if aliases:
-                for alias in aliases:
-                    score = fuzz.ratio(query_lower, alias.lower())
-                    if score > best_score:
-                        best_score = score
-                        matched_field = "alias"
+            # Candidate (field, value) pairs, in priority order for equal scores
+            candidates = [("canonical_name", canonical_name)]
+            candidates.extend(("alias", alias) for alias in aliases or ())
 
-            # Check phone
+            # An exact phone match (after normalization) always wins
+            phone_exact = False
             if phone:
                 norm_query_phone = _normalize_phone(query)
                 norm_phone = _normalize_phone(phone)
                 if norm_query_phone and norm_phone:
                     if norm_query_phone == norm_phone:
-                        best_score = 100.0
-                        matched_field = "phone"
+                        phone_exact = True
                     else:
-                        score = fuzz.ratio(query_lower, phone.lower())
-                        if score > best_score:
-                            best_score = score
-                            matched_field = "phone"
+                        candidates.append(("phone", phone))
 
-            # Check email
-            if email:
-                score = fuzz.ratio(query_lower, email.lower())
-                if score > best_score:
-                    best_score = score
-                    matched_field = "email"
+            for field, value in (("email", email), ("relationship", relationship), ("notes", notes)):
+                if value:
+                    candidates.append((field, value))
 
-            # Check relationship
-            if relationship:
-                score = fuzz.ratio(query_lower, relationship.lower())
+            for field, value in candidates:
+                # Scores below the running cutoff can't change the result; rapidfuzz
+                # uses it to bail out early on hopeless candidates (returning 0)
+                score = fuzz.ratio(query_lower, value.lower(), score_cutoff=max(best_score, 50))
                 if score > best_score:
                     best_score = score
-                    matched_field = "relationship"
+                    matched_field = field
 
-            # Check notes
-            if notes:
-                score = fuzz.ratio(query_lower, notes.lower())
-                if score > best_score:
-                    best_score = score
-                    matched_field = "notes"
+            if phone_exact:
+                best_score = 100.0
+                matched_field = "phone"
 
             # Only include if score >= 50
             if best_score >= 50:
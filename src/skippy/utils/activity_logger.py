@@ -1,6 +1,7 @@
 """Activity logging utility for unified event tracking."""
-import json
 import logging
+
+import orjson
 from skippy.db_utils import get_db_connection
 
 from skippy.config import settings
@@ -35,7 +36,14 @@ async def log_activity(
                         (user_id, activity_type, entity_type, entity_id, description, metadata)
                     VALUES (%s, %s, %s, %s, %s, %s::jsonb)
                     """,
-                    (user_id, activity_type, entity_type, entity_id, description, json.dumps(metadata or {})),
+                    (
+                        user_id,
+                        activity_type,
+                        entity_type,
+                        entity_id,
+                        description,
+                        orjson.dumps(metadata or {}, option=orjson.OPT_NON_STR_KEYS).decode(),
+                    ),
                 )
     except Exception:
         logger.exception("Failed to log activity")
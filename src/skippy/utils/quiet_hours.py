@@ -8,11 +8,14 @@ Non-critical notifications arriving during quiet hours are stored in the
 notification_queue table and delivered when the next active window begins.
 """
 
-import json
 import logging
+import time as _time
 from datetime import datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from skippy.config import settings
 from skippy.db_utils import get_db_connection
 
@@ -30,9 +33,17 @@ def is_quiet_time(tz: str | None = None) -> bool:
     Quiet hours:
       - Weekdays: before 07:00 or at/after 21:30
       - Weekends: before 09:00 or at/after 21:30
+
+    The answer is memoized per wall-clock second, so a burst of parallel
+    notification tools only does the timezone math once.
     """
-    zone = ZoneInfo(tz or settings.timezone)
-    now = datetime.now(zone)
+    return _is_quiet_at(int(_time.time()), tz or settings.timezone)
+
+
+@lru_cache(maxsize=4)
+def _is_quiet_at(epoch_second: int, tz: str) -> bool:
+    """Quiet-hours check for a given epoch second in the named timezone."""
+    now = datetime.fromtimestamp(epoch_second, ZoneInfo(tz))
     current = now.time()
     is_weekend = now.weekday() >= 5  # Saturday=5, Sunday=6
     active_start = _WEEKEND_START if is_weekend else _WEEKDAY_START
@@ -87,7 +98,7 @@ async def queue_notification(tool_name: str, params: dict) -> str:
                     INSERT INTO notification_queue (tool_name, params, send_at)
                     VALUES (%s, %s::jsonb, %s)
                     """,
-                    (tool_name, json.dumps(params), send_at),
+                    (tool_name, orjson.dumps(params).decode(), send_at),
                 )
         logger.info("Queued %s notification for %s", tool_name, send_at.strftime("%H:%M"))
         return f"Quiet hours — queued for delivery at {send_at.strftime('%I:%M %p')}."
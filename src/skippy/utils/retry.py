@@ -0,0 +1,67 @@
+"""Timeout and retry wrapper for external API calls (HA, Google, Twilio)."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger("skippy")
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _status_of(exc: BaseException) -> int | None:
+    """Extract an HTTP status from httpx, googleapiclient, or Twilio errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code
+    # googleapiclient.errors.HttpError exposes status_code, TwilioRestException status
+    status = getattr(exc, "status_code", None) or getattr(exc, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True for timeouts, connection failures, and 429/5xx responses."""
+    if isinstance(exc, (TimeoutError, httpx.TimeoutException, httpx.TransportError)):
+        return True
+    return _status_of(exc) in _RETRYABLE_STATUSES
+
+
+def is_unsent(exc: BaseException) -> bool:
+    """Return True for httpx errors raised before the request reached the server."""
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+async def with_timeout_and_retry(
+    fn: Callable[..., Awaitable[Any]],
+    *args: Any,
+    timeout: float,
+    retries: int = 2,
+    backoff: float = 0.25,
+    retry_if: Callable[[BaseException], bool] = is_retryable,
+    **kwargs: Any,
+) -> Any:
+    """Await fn(*args, **kwargs) under a timeout, retrying transient failures.
+
+    Each attempt is bounded by asyncio.wait_for; errors accepted by `retry_if`
+    (is_retryable by default) are retried up to `retries` times with
+    exponential backoff. Anything else — and the last failure — propagates.
+
+    Non-idempotent calls (e.g. sending a notification) must not retry after a
+    timeout or 5xx, when the first attempt may still have gone through: pass
+    retry_if=is_unsent to retry only requests that never left, or retries=0.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return await asyncio.wait_for(fn(*args, **kwargs), timeout)
+        except Exception as e:
+            if attempt == retries or not retry_if(e):
+                raise
+            delay = backoff * 2**attempt
+            logger.warning(
+                "Retrying %s after %s (attempt %d/%d, %.2fs)",
+                getattr(fn, "__name__", fn), type(e).__name__, attempt + 1, retries, delay,
+            )
+            await asyncio.sleep(delay)
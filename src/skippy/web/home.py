@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Body
 from fastapi.responses import HTMLResponse
+from psycopg.rows import dict_row
 
 from skippy.config import settings
 from skippy.db_utils import get_db_connection
@@ -165,7 +166,7 @@ async def get_recent_activity():
     """Return the last 10 activities across all subsystems."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute(
                     """
                     SELECT activity_id, activity_type, entity_type, entity_id,
@@ -176,15 +177,10 @@ async def get_recent_activity():
                     LIMIT 10
                     """
                 )
-                rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-
-                results = []
-                for row in rows:
-                    activity = dict(zip(columns, row))
+                results = await cur.fetchall()
+                for activity in results:
                     if activity.get("created_at"):
                         activity["created_at"] = activity["created_at"].isoformat()
-                    results.append(activity)
 
                 return results
     except Exception:
@@ -583,7 +579,7 @@ async def get_tasks_today():
     """Return tasks for Today panel: active tasks not deferred."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute(
                     """
                     SELECT task_id, title, project, priority, due_date, status,
@@ -597,15 +593,10 @@ async def get_tasks_today():
                     LIMIT 20
                     """
                 )
-                rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-
-                tasks = []
-                for row in rows:
-                    task = dict(zip(columns, row))
+                tasks = await cur.fetchall()
+                for task in tasks:
                     if task.get("due_date"):
                         task["due_date"] = task["due_date"].isoformat()
-                    tasks.append(task)
 
                 return {"tasks": tasks}
     except Exception:
@@ -618,7 +609,7 @@ async def get_tasks_backlog():
     """Return backlog tasks sorted by backlog_rank."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute(
                     """
                     SELECT task_id, title, project, priority, tags, backlog_rank,
@@ -631,15 +622,10 @@ async def get_tasks_backlog():
                     LIMIT 50
                     """
                 )
-                rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-
-                tasks = []
-                for row in rows:
-                    task = dict(zip(columns, row))
+                tasks = await cur.fetchall()
+                for task in tasks:
                     if task.get("created_at"):
                         task["created_at"] = task["created_at"].isoformat()
-                    tasks.append(task)
 
                 return {"tasks": tasks}
     except Exception:
@@ -2,6 +2,8 @@ import json
 import logging
 from datetime import datetime
 
+from psycopg.rows import dict_row
+
 from skippy.db_utils import get_db_connection
 from fastapi import APIRouter, Body
 from fastapi.responses import HTMLResponse, RedirectResponse
@@ -19,7 +21,7 @@ async def get_people():
     """Return all people as JSON."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute("""
                     SELECT
                         person_id, canonical_name, relationship, phone, email,
@@ -29,10 +31,7 @@ async def get_people():
                     WHERE canonical_name IS NOT NULL AND canonical_name != ''
                     ORDER BY importance_score DESC
                 """)
-                rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-                people = [dict(zip(columns, row)) for row in rows]
-                return people
+                return await cur.fetchall()
     except Exception as e:
         logger.error(f"Failed to get people: {e}")
         return []
@@ -56,7 +55,7 @@ async def get_person_profile(person_id: int):
     """Get detailed person profile with memories."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 # Get person details
                 await cur.execute("""
                     SELECT person_id, canonical_name, aliases, relationship, phone, email,
@@ -64,12 +63,10 @@ async def get_person_profile(person_id: int):
                     FROM people
                     WHERE person_id = %s
                 """, (person_id,))
-                row = await cur.fetchone()
-                if not row:
+                person = await cur.fetchone()
+                if not person:
                     return {"error": "Person not found"}
 
-                person = dict(zip([desc.name for desc in cur.description], row))
-
                 # Parse aliases JSON
                 if person.get('aliases'):
                     try:
@@ -85,10 +82,7 @@ async def get_person_profile(person_id: int):
                     ORDER BY created_at DESC
                     LIMIT 50
                 """, (person_id,))
-                memories = [
-                    dict(zip([desc.name for desc in cur.description], m))
-                    for m in await cur.fetchall()
-                ]
+                memories = await cur.fetchall()
 
                 person['memories'] = memories
                 return person
@@ -3,6 +3,7 @@
 import logging
 from fastapi import APIRouter, Body
 from fastapi.responses import HTMLResponse
+from psycopg.rows import dict_row
 from skippy.db_utils import get_db_connection
 
 from skippy.config import settings
@@ -17,7 +18,7 @@ async def get_reminders():
     """Get all reminders."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute("""
                     SELECT reminder_id, event_id, event_summary, event_start,
                            reminded_at, acknowledged_at, snoozed_until, status,
@@ -27,9 +28,7 @@ async def get_reminders():
                     ORDER BY event_start DESC
                     LIMIT 100
                 """, ("nolan",))
-                rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-                return [dict(zip(columns, row)) for row in rows]
+                return await cur.fetchall()
     except Exception as e:
         logger.error(f"Failed to get reminders: {e}")
         return []
@@ -40,7 +39,7 @@ async def get_pending_reminders():
     """Get pending reminders."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute("""
                     SELECT reminder_id, event_id, event_summary, event_start,
                            reminded_at, acknowledged_at, snoozed_until, status,
@@ -51,9 +50,7 @@ async def get_pending_reminders():
                       AND (snoozed_until IS NULL OR snoozed_until < NOW())
                     ORDER BY event_start
                 """, ("nolan",))
-                rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-                return [dict(zip(columns, row)) for row in rows]
+                return await cur.fetchall()
     except Exception as e:
         logger.error(f"Failed to get pending reminders: {e}")
         return []
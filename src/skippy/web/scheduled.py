@@ -4,6 +4,7 @@ import json
 import logging
 from fastapi import APIRouter, Body
 from fastapi.responses import HTMLResponse
+from psycopg.rows import dict_row
 from skippy.db_utils import get_db_connection
 
 from skippy.config import settings
@@ -18,18 +19,15 @@ async def get_scheduled_tasks():
     """Get all scheduled tasks."""
     try:
         async with get_db_connection() as conn:
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute("""
                     SELECT task_id, name, description, schedule_type,
                            schedule_config, enabled, source, created_at, ran_at
                     FROM scheduled_tasks
                     ORDER BY created_at DESC
                 """)
-                rows = await cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-                tasks = []
-                for row in rows:
-                    task_dict = dict(zip(columns, row))
+                tasks = await cur.fetchall()
+                for task_dict in tasks:
                     # Parse schedule_config JSON
                     if isinstance(task_dict.get('schedule_config'), str):
                         try:
@@ -40,7 +38,6 @@ async def get_scheduled_tasks():
                     for dt_field in ('created_at', 'ran_at'):
                         if task_dict.get(dt_field) is not None:
                             task_dict[dt_field] = task_dict[dt_field].isoformat()
-                    tasks.append(task_dict)
                 return tasks
     except Exception as e:
         logger.error(f"Failed to get scheduled tasks: {e}")
@@ -0,0 +1,25 @@
+"""Tests for quiet-hours checks."""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from skippy.utils.quiet_hours import _is_quiet_at
+
+_TZ = "America/Chicago"
+
+
+def _epoch(*args) -> int:
+    return int(datetime(*args, tzinfo=ZoneInfo(_TZ)).timestamp())
+
+
+class TestIsQuietAt:
+    def test_weekday_boundaries(self):
+        # 2026-02-16 is a Monday
+        assert _is_quiet_at(_epoch(2026, 2, 16, 6, 59), _TZ)
+        assert not _is_quiet_at(_epoch(2026, 2, 16, 7, 0), _TZ)
+        assert _is_quiet_at(_epoch(2026, 2, 16, 21, 30), _TZ)
+
+    def test_weekend_starts_later(self):
+        # 2026-02-15 is a Sunday
+        assert _is_quiet_at(_epoch(2026, 2, 15, 8, 30), _TZ)
+        assert not _is_quiet_at(_epoch(2026, 2, 15, 9, 0), _TZ)
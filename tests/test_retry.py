@@ -0,0 +1,82 @@
+"""Tests for the external-call timeout/retry wrapper."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from skippy.utils.retry import is_retryable, is_unsent, with_timeout_and_retry
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://ha.local/api")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError("boom", request=request, response=response)
+
+
+class TestIsRetryable:
+    def test_timeouts_and_transport_errors(self):
+        assert is_retryable(TimeoutError())
+        assert is_retryable(httpx.ConnectError("refused"))
+
+    def test_server_and_rate_limit_statuses(self):
+        assert is_retryable(_status_error(503))
+        assert is_retryable(_status_error(429))
+
+    def test_client_errors_not_retried(self):
+        assert not is_retryable(_status_error(400))
+        assert not is_retryable(ValueError("bad input"))
+
+
+class TestIsUnsent:
+    def test_connection_phase_errors(self):
+        assert is_unsent(httpx.ConnectError("refused"))
+        assert is_unsent(httpx.ConnectTimeout("slow connect"))
+        assert is_unsent(httpx.PoolTimeout("pool full"))
+
+    def test_errors_after_sending(self):
+        assert not is_unsent(httpx.ReadTimeout("slow response"))
+        assert not is_unsent(_status_error(503))
+
+
+class TestWithTimeoutAndRetry:
+    async def test_retries_until_success(self):
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise _status_error(502)
+            return "ok"
+
+        assert await with_timeout_and_retry(flaky, timeout=1, backoff=0) == "ok"
+        assert len(calls) == 3
+
+    async def test_non_retryable_raises_immediately(self):
+        calls = []
+
+        async def bad():
+            calls.append(1)
+            raise _status_error(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await with_timeout_and_retry(bad, timeout=1, backoff=0)
+        assert len(calls) == 1
+
+    async def test_timeout_without_retries(self):
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(TimeoutError):
+            await with_timeout_and_retry(slow, timeout=0.01, retries=0)
+
+    async def test_retry_if_limits_what_is_retried(self):
+        calls = []
+
+        async def gateway_error():
+            calls.append(1)
+            raise _status_error(502)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await with_timeout_and_retry(gateway_error, timeout=1, backoff=0, retry_if=is_unsent)
+        assert len(calls) == 1
@@ -1,16 +1,22 @@
 """Tests for Google Calendar tools."""
 
-import pytest
+import threading
 from datetime import datetime
 from zoneinfo import ZoneInfo
+
+import pytest
 from tests.conftest import requires_google_calendar
 
+import skippy.tools.google_calendar as gc
 from skippy.config import settings
 from skippy.tools.google_calendar import (
     _build_rrule,
+    _clock_from_iso,
     _format_event,
     _format_event_with_date,
     _resolve_datetime,
+    _utc_now,
+    get_calendar_overview,
     get_todays_events,
     get_upcoming_events,
 )
@@ -60,6 +66,21 @@ class TestFormatEvent:
         assert "(no title)" in result
 
 
+class TestClockFromIso:
+    def test_matches_strftime(self):
+        for value in (
+            "2026-02-15T00:05:00-06:00",
+            "2026-02-15T09:30:00-06:00",
+            "2026-02-15T12:00:00Z",
+            "2026-02-15T23:45:00+01:00",
+        ):
+            expected = datetime.fromisoformat(value).strftime("%I:%M %p")
+            assert _clock_from_iso(value) == expected
+
+    def test_non_rfc3339_falls_back(self):
+        assert _clock_from_iso("2026-02-15 14:30") == "02:30 PM"
+
+
 class TestFormatEventWithDate:
     def test_timed_event_includes_date(self):
         event = {
@@ -82,6 +103,24 @@ class TestFormatEventWithDate:
         assert "All day" in result
 
 
+class TestUtcNow:
+    def test_iso_matches_datetime(self):
+        now, now_iso = _utc_now()
+        assert now.tzinfo is not None
+        assert now_iso == now.isoformat()
+
+    def test_reused_within_same_second(self, monkeypatch):
+        monkeypatch.setattr(gc, "_now_cache", None)
+        monkeypatch.setattr(gc.time, "time", lambda: 1000.2)
+        first = _utc_now()
+        monkeypatch.setattr(gc.time, "time", lambda: 1000.9)
+        assert _utc_now() == first
+        monkeypatch.setattr(gc.time, "time", lambda: 1001.0)
+        assert gc._now_cache[0] == 1000
+        _utc_now()
+        assert gc._now_cache[0] == 1001
+
+
 class TestResolveDateTime:
     def test_today(self):
         tz = ZoneInfo(settings.timezone)
@@ -201,6 +240,16 @@ class TestBuildRrule:
         )
         assert result == "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR;COUNT=20"
 
+    def test_weekly_with_mixed_case_abbreviations(self):
+        result = _build_rrule("weekly", days_of_week="Monday, we,Fr")
+        assert result == "RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR"
+
+    def test_unrecognized_day_error_names_the_day(self):
+        with pytest.raises(ValueError, match="Unrecognized day: 'Funday'") as exc_info:
+            _build_rrule("weekly", days_of_week="Monday, Funday ")
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.__suppress_context__
+
     def test_invalid_day_raises(self):
         with pytest.raises(ValueError) as exc_info:
             _build_rrule("weekly", days_of_week="Monday,Funday")
@@ -229,3 +278,40 @@ def test_get_upcoming_events():
     result = get_upcoming_events.invoke({"days": 7})
     assert isinstance(result, str)
     assert len(result) > 0
+
+
+@requires_google_calendar
+async def test_get_calendar_overview():
+    """Should combine today's and upcoming events in one string."""
+    result = await get_calendar_overview.ainvoke({"days": 7})
+    assert isinstance(result, str)
+    assert "today" in result.lower()
+    assert "next 7 days" in result
+
+
+async def test_get_calendar_overview_sets_up_in_threads(monkeypatch):
+    """Service and Http setup should run off the event loop, one Http per fetch."""
+    main = threading.get_ident()
+    setup_threads = []
+    https = []
+
+    def fake_service():
+        setup_threads.append(threading.get_ident())
+        return object()
+
+    def fake_http(credentials):
+        https.append(object())
+        return https[-1]
+
+    monkeypatch.setattr(gc, "_get_calendar_service", fake_service)
+    monkeypatch.setattr(gc, "_get_calendar_credentials", lambda: "creds")
+    monkeypatch.setattr(gc, "new_authorized_http", fake_http)
+    monkeypatch.setattr(gc, "_todays_events_text", lambda service, http=None: "today")
+    monkeypatch.setattr(
+        gc, "_upcoming_events_text", lambda service, days, http=None: f"next {days}"
+    )
+
+    result = await get_calendar_overview.ainvoke({"days": 3})
+    assert result == "today\n\nnext 3"
+    assert len(setup_threads) == 2 and main not in setup_threads
+    assert len(https) == 2 and https[0] is not https[1]
@@ -3,7 +3,76 @@
 import pytest
 from tests.conftest import requires_google_oauth
 
-from skippy.tools.google_contacts import search_contacts
+from skippy.tools import google_contacts as gcontacts
+from skippy.tools.google_contacts import (
+    _build_person_body,
+    _format_contact,
+    _person_fields,
+    search_contacts,
+    update_contact,
+)
+
+
+class TestBuildPersonBody:
+    def test_name_only(self):
+        assert _build_person_body("Ada") == {"names": [{"givenName": "Ada"}]}
+
+    def test_all_fields(self):
+        body = _build_person_body("Ada", "ada@example.com", "555-0100", "Acme", "Met at PyCon")
+        assert body["emailAddresses"] == [{"value": "ada@example.com"}]
+        assert body["phoneNumbers"] == [{"value": "555-0100"}]
+        assert body["organizations"] == [{"name": "Acme"}]
+        assert body["biographies"] == [{"value": "Met at PyCon", "contentType": "TEXT_PLAIN"}]
+
+
+class TestPersonFields:
+    def test_only_non_empty_fields(self):
+        assert _person_fields(name="", email="a@b.c", phone="") == {
+            "emailAddresses": [{"value": "a@b.c"}]
+        }
+
+    def test_nothing_set(self):
+        assert _person_fields(name="", email="") == {}
+
+
+class TestFormatContact:
+    def test_all_sections(self):
+        person = {
+            "resourceName": "people/c1",
+            "names": [{"displayName": "Ada Lovelace"}],
+            "emailAddresses": [{"value": "ada@example.com", "type": "home"}],
+            "phoneNumbers": [{"value": "555-0100", "type": "mobile"}],
+            "addresses": [{"formattedValue": "1 Main St"}],
+            "organizations": [{"title": "Analyst", "name": "Acme"}, {"name": "Guild"}],
+            "birthdays": [{"date": {"year": 1815, "month": 12, "day": 10}}, {"date": {"month": 1, "day": 2}}],
+            "biographies": [{"value": "x" * 300}],
+        }
+        assert _format_contact(person).split("\n") == [
+            "**Ada Lovelace** [resource: people/c1]",
+            "  Email: ada@example.com (home)",
+            "  Phone: 555-0100 (mobile)",
+            "  Address: 1 Main St",
+            "  Work: Analyst at Acme",
+            "  Work: Guild",
+            "  Birthday: 1815-12/10",
+            "  Birthday: 1/2",
+            "  Notes: " + "x" * 200,
+        ]
+
+    def test_no_name(self):
+        assert _format_contact({}) == "**(no name)** [resource: ]"
+
+
+
+async def test_update_contact_without_fields_skips_api(monkeypatch):
+    """An update with no fields should return early without touching the People API."""
+
+    def fail():
+        raise AssertionError("People API should not be called")
+
+    monkeypatch.setattr(gcontacts, "_get_people_service", fail)
+    result = await update_contact.ainvoke({"resource_name": "people/c1"})
+    assert result.startswith("No fields to update")
 
 
 @requires_google_oauth
@@ -1,8 +1,17 @@
 """Tests for Home Assistant communication tools."""
 
-import pytest
+import asyncio
 
-from skippy.tools.home_assistant import get_tools, send_notification, send_sms
+import httpx
+
+from skippy.tools import home_assistant as ha
+from skippy.tools.home_assistant import (
+    _MAX_ERROR_CHARS,
+    _format_error,
+    get_tools,
+    send_notification,
+    send_sms,
+)
 
 
 def test_get_tools_returns_list():
@@ -27,3 +36,42 @@ def test_sms_tool_exists():
     # send_sms is included if Twilio is configured
     # (may or may not be present depending on config)
     assert "send_sms" in tool_names or len(tools) >= 0
+
+
+async def test_send_notification_delivers_in_background(monkeypatch):
+    """send_notification should return before delivery and drain should await it."""
+    delivered = asyncio.Event()
+
+    async def fake_deliver(message, title="Skippy"):
+        await asyncio.sleep(0)
+        delivered.set()
+        return "ok"
+
+    monkeypatch.setattr(ha, "_deliver_ha_push", fake_deliver)
+    result = await send_notification.ainvoke(
+        {"message": "hi", "title": "T", "is_critical": True}
+    )
+    assert result.startswith("Notification queued")
+    assert not delivered.is_set()
+
+    await ha.drain_notifications()
+    assert delivered.is_set()
+    assert not ha._pending_deliveries
+
+
+async def test_deliver_ha_push_reports_transport_errors(monkeypatch):
+    """Connection failures should come back as a message, not an exception."""
+
+    async def boom(*args, **kwargs):
+        raise httpx.ConnectError("unreachable")
+
+    monkeypatch.setattr(ha, "with_timeout_and_retry", boom)
+    result = await ha._deliver_ha_push("hi")
+    assert result.startswith("Failed to send notification")
+
+
+def test_format_error_truncates_long_messages():
+    assert _format_error(ValueError("short")) == "short"
+    long = _format_error(ValueError("x" * 5000))
+    assert len(long) == _MAX_ERROR_CHARS + 1
+    assert long.endswith("…")
@@ -62,3 +62,109 @@ async def test_list_people():
     """list_people should return a string."""
     result = await list_people.ainvoke({})
     assert isinstance(result, str)
+
+
+class _FakeCursor:
+    """Cursor that misses every exact-match query and returns `people` for the rest."""
+
+    def __init__(self, people):
+        self.people = people
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, *args, **kwargs):
+        pass
+
+    async def fetchone(self):
+        return None
+
+    async def fetchall(self):
+        return self.people
+
+
+class _FakeConnection:
+    def __init__(self, people):
+        self.people = people
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def cursor(self, **kwargs):
+        return _FakeCursor(self.people)
+
+
+@pytest.fixture
+def fake_people(monkeypatch):
+    from skippy.tools import people as people_mod
+
+    def install(rows):
+        monkeypatch.setattr(people_mod, "get_db_connection", lambda: _FakeConnection(rows))
+
+    return install
+
+
+async def test_resolve_person_fuzzy_alias(fake_people):
+    """Fuzzy matching should score aliases and report which field matched."""
+    from skippy.tools.people import _resolve_person_identity
+
+    fake_people([(1, "Robert Smith", ["Bobby"]), (2, "Alice Jones", ["Ali"])])
+    result = await _resolve_person_identity("Bobbie")
+    assert result["person_id"] == 1
+    assert result["matched_field"] == "alias"
+    assert result["suggestion"] is True
+
+
+async def test_resolve_person_fuzzy_prefers_first_on_tie(fake_people):
+    from skippy.tools.people import _resolve_person_identity
+
+    fake_people([(1, "Sam Lee", []), (2, "Sam Lee", None)])
+    result = await _resolve_person_identity("sam")
+    assert result["person_id"] == 1
+    assert result["matched_field"] == "canonical_name"
+    assert result["suggestion"] is False
+
+
+async def test_resolve_person_no_match(fake_people):
+    from skippy.tools.people import _resolve_person_identity
+
+    fake_people([(1, "Robert Smith", [])])
+    with pytest.raises(ValueError, match="No person found"):
+        await _resolve_person_identity("zzzz")
+
+
+async def test_search_people_fuzzy_ranks_fields(fake_people):
+    from skippy.tools.people import search_people_fuzzy
+
+    fake_people([
+        (1, "Robert Smith", ["Bobby"], "555-123-4567", None, "brother", None),
+        (2, "Alice Jones", [], None, "alice@example.com", "coworker", None),
+        (3, "Zed Zulu", [], None, None, None, None),
+    ])
+    result = await search_people_fuzzy.ainvoke({"query": "bobby"})
+    assert "Robert Smith (100% via alias)" in result
+    assert "Zed Zulu" not in result
+
+    result = await search_people_fuzzy.ainvoke({"query": "(555) 123-4567"})
+    assert "Robert Smith (100% via phone)" in result
+
+
+async def test_find_duplicate_people_clusters_similar_names(fake_people):
+    import json
+
+    from skippy.tools.people import find_duplicate_people
+
+    fake_people([
+        (1, "Robert Smith", [], None, None),
+        (2, "Alice Jones", [], None, "alice@example.com"),
+        (3, "Robert J Smith", [], None, None),
+        (4, "Alicia", ["alice jones"], None, None),
+    ])
+    clusters = json.loads(await find_duplicate_people.ainvoke({"threshold": 90}))
+    assert [[m["person_id"] for m in c["members"]] for c in clusters] == [[1, 3], [2, 4]]